@@ -1,20 +1,64 @@
+import logging
+from itertools import islice
+
 import chainlit as cl
+from agents.exceptions import ModelBehaviorError
+from openai import APITimeoutError, RateLimitError
 
 from src.verifact_manager import VerifactManager
+from utils.search.search_tools import close_http_client
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of evidence items shown per claim
+MAX_EVIDENCE_DISPLAYED = 20
+
+CLAIM_RESULT_TEMPLATE = (
+    "\n---\n**Claim {number}:** {claim}\n"
+    "**Evidence:**\n{evidence}\n"
+    "\n**Verdict:** {verdict}\n"
+    "**Confidence:** {confidence}\n"
+    "**Explanation:** {explanation}\n"
+    "**Sources:**\n{sources}\n"
+)
+
+# Short user-facing messages per error type; the full traceback is only logged
+ERROR_MESSAGES = {
+    RateLimitError: "The service is busy, please try again in a moment.",
+    APITimeoutError: "The request timed out, please try again.",
+    ModelBehaviorError: "Received a malformed response while fact-checking.",
+}
+DEFAULT_ERROR_MESSAGE = "An error occurred during fact-checking."
+
+
+def error_message(error: Exception) -> str:
+    """Return the user-facing message for an error, matching its closest listed base class."""
+    return next(
+        (ERROR_MESSAGES[cls] for cls in type(error).__mro__ if cls in ERROR_MESSAGES),
+        DEFAULT_ERROR_MESSAGE,
+    )
+
 
 pipeline = VerifactManager()
 
 
+def format_evidence(ev) -> str:
+    """Format a single evidence item as a markdown list entry."""
+    return f"- {ev.content} (Source: {ev.source}, Stance: {ev.stance}, Relevance: {ev.relevance})"
+
+
+@cl.on_app_shutdown
+async def on_app_shutdown():
+    await close_http_client()
+
+
 @cl.on_message
 async def handle_message(message: cl.Message):
-    progress_msg = cl.Message(content="Starting fact-checking pipeline...")
-    await progress_msg.send()
-    progress_updates = []
+    # Not sent up front: the first streamed progress token sends the message
+    progress_msg = cl.Message(content="")
 
     async def progress_callback(msg, update):
-        progress_updates.append(update)
-        msg.content = "\n".join(progress_updates)
-        await msg.update()
+        await msg.stream_token(f"{update}\n")
 
     try:
         verdicts = await pipeline.run(
@@ -25,36 +69,32 @@ async def handle_message(message: cl.Message):
             await progress_msg.update()
             return
         # Format the final organized message
-        response = ""
+        parts = []
         for idx, (claim, evidence, verdict) in enumerate(verdicts):
-            claim_text = getattr(claim, "text", str(claim))
-            verdict_text = getattr(verdict, "verdict", str(verdict))
-            confidence = getattr(verdict, "confidence", "N/A")
-            explanation = getattr(verdict, "explanation", "N/A")
-            sources = getattr(verdict, "sources", [])
-            sources_str = "\n".join(sources) if sources else "No sources provided."
+            sources_str = "\n".join(verdict.sources) if verdict.sources else "No sources provided."
             # Evidence formatting
             if evidence:
                 evidence_str = "\n".join(
-                    [
-                        f"- {getattr(ev, 'content', str(ev))} (Source: {getattr(ev, 'source', 'N/A')}, Stance: {getattr(ev, 'stance', 'N/A')}, Relevance: {getattr(ev, 'relevance', 'N/A')})"
-                        for ev in evidence
-                    ]
+                    format_evidence(ev) for ev in islice(evidence, MAX_EVIDENCE_DISPLAYED)
                 )
             else:
                 evidence_str = "No evidence found."
-            response += (
-                f"\n---\n**Claim {idx + 1}:** {claim_text}\n"
-                f"**Evidence:**\n{evidence_str}\n"
-                f"\n**Verdict:** {verdict_text}\n"
-                f"**Confidence:** {confidence}\n"
-                f"**Explanation:** {explanation}\n"
-                f"**Sources:**\n{sources_str}\n"
+            parts.append(
+                CLAIM_RESULT_TEMPLATE.format(
+                    number=idx + 1,
+                    claim=claim.text,
+                    evidence=evidence_str,
+                    verdict=verdict.verdict,
+                    confidence=verdict.confidence,
+                    explanation=verdict.explanation,
+                    sources=sources_str,
+                )
             )
-        progress_msg.content = response
+        progress_msg.content = "".join(parts)
         await progress_msg.update()
     except Exception as e:
-        progress_msg.content = f"An error occurred during fact-checking: {e!s}"
+        logger.exception("Fact-checking pipeline failed")
+        progress_msg.content = f"❌ {error_message(e)}"
         await progress_msg.update()
 
 
@@ -9,7 +9,7 @@ router = APIRouter(prefix="/api/v1")
 
 @router.post("/factcheck", response_model=FactCheckResponse)
 async def factcheck(request: FactCheckRequest):
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
 
     # Extract the text to be fact-checked from the request
     text_to_check = request.text
@@ -30,7 +30,7 @@ async def factcheck(request: FactCheckRequest):
             )
         ],
         metadata={
-            "processing_time": f"{time.time() - start_time:.1f}s",
+            "processing_time": f"{(time.perf_counter_ns() - start_ns) / 1e9:.1f}s",
             "model_version": "1.0.4",
             "input_length": len(text_to_check),
             "options_used": {
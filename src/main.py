@@ -1,14 +1,28 @@
+from contextlib import asynccontextmanager
+
 from dotenv import load_dotenv
 from fastapi import FastAPI
 
 from api.factcheck import router as factcheck_router
 from utils.logging.logging_config import setup_logging
+from utils.search.search_tools import close_http_client
 
 load_dotenv()
 setup_logging()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Close shared resources when the API shuts down."""
+    yield
+    await close_http_client()
+
+
 app = FastAPI(
-    title="Fact Check API", description="API for fact-checking claims in text", version="1.0.0"
+    title="Fact Check API",
+    description="API for fact-checking claims in text",
+    version="1.0.0",
+    lifespan=lifespan,
 )
 
 
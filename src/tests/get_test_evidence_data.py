@@ -141,9 +141,7 @@ def attach_wiki_content_to_claims(
         evidences = claim.get("evidence", [])
         wiki_evidences = []
         wiki_evidences.extend(
-            process_evidence_item(item, wiki_index)
-            for group in evidences
-            for item in group
+            process_evidence_item(item, wiki_index) for group in evidences for item in group
         )
         enriched.append(
             {
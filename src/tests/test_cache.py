@@ -0,0 +1,54 @@
+"""Unit tests for the in-process cache utilities."""
+
+import pytest
+
+from utils.cache.lru_cache import LRUCache, normalize_text, text_cache_key
+
+# Test constants
+TEST_CACHE_MAXSIZE = 2
+
+
+class TestLRUCache:
+    """Tests for the bounded LRU cache."""
+
+    def test_get_returns_default_on_miss(self):
+        """Test that missing keys return the default value."""
+        cache = LRUCache(maxsize=2)
+        assert cache.get("missing") is None
+        assert cache.get("missing", "fallback") == "fallback"
+
+    def test_evicts_least_recently_used(self):
+        """Test that the least recently used entry is evicted when full."""
+        cache = LRUCache(maxsize=TEST_CACHE_MAXSIZE)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1  # "b" is now the least recently used
+        cache.set("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert len(cache) == TEST_CACHE_MAXSIZE
+
+    def test_invalid_maxsize(self):
+        """Test that a non-positive maxsize is rejected."""
+        with pytest.raises(ValueError, match="maxsize must be at least 1"):
+            LRUCache(maxsize=0)
+
+
+@pytest.mark.parametrize(
+    ("first", "second"),
+    [
+        ("The Earth is round", "the earth is round"),
+        ("  The   Earth is\tround ", "The Earth is round"),
+    ],
+)
+def test_text_cache_key_ignores_case_and_whitespace(first, second):
+    """Test that equivalent texts map to the same cache key."""
+    assert normalize_text(first) == normalize_text(second)
+    assert text_cache_key(first) == text_cache_key(second)
+
+
+def test_text_cache_key_differs_for_different_text():
+    """Test that different texts map to different cache keys."""
+    assert text_cache_key("The Earth is round") != text_cache_key("The Earth is flat")
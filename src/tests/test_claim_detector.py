@@ -5,11 +5,13 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 from dotenv import load_dotenv
+from pydantic import ValidationError
 
 from verifact_agents.claim_detector import (
     MAX_CLAIMS_PER_REQUEST,
     MIN_TEXT_LENGTH,
     Claim,
+    ClaimDetector,
     claim_detector,
     process_claims,
 )
@@ -222,6 +224,85 @@ class TestClaimDetector:
         assert len(duplicate_claims) == 1
         assert duplicate_claims[0].check_worthiness == HIGHER_SCORE_VALUE  # Higher score kept
 
+    def test_claim_detector_deduplication_near_duplicates(self):
+        """Test that reworded near-duplicate claims are collapsed."""
+        claims_in = [
+            Claim(text="Company X reported $2.3 billion in revenue.", check_worthiness=0.7),
+            Claim(text="Company X reported $2.3 billion in revenues", check_worthiness=0.8),
+            Claim(text="Researchers noted the sample size was small.", check_worthiness=0.6),
+        ]
+
+        deduplicated = claim_detector._deduplicate_claims(claims_in)
+
+        assert [c.text for c in deduplicated] == [claims_in[1].text, claims_in[2].text]
+
+    @pytest.mark.parametrize(
+        ("first", "second"),
+        [
+            ("Unemployment rose to 5.1% in 2020.", "Unemployment rose to 5.7% in 2020."),
+            ("The company was founded in 1998.", "The company was founded in 1989."),
+            ("Vaccine X is 95% effective.", "Vaccine X is 59% effective."),
+            (
+                "Drug A reduces mortality by 30 percent.",
+                "Drug A increases mortality by 30 percent.",
+            ),
+            ("The vaccine is safe for children.", "The vaccine is not safe for children."),
+            ("The vaccine is safe for children.", "The vaccine isn't safe for children."),
+        ],
+    )
+    def test_claim_detector_deduplication_keeps_distinct_claims(self, first, second):
+        """Test that claims differing in a number, verb or negation are both kept."""
+        claims_in = [
+            Claim(text=first, check_worthiness=0.8),
+            Claim(text=second, check_worthiness=0.7),
+        ]
+
+        deduplicated = claim_detector._deduplicate_claims(claims_in)
+
+        assert deduplicated == claims_in
+
+    @pytest.mark.asyncio
+    @patch("verifact_agents.claim_detector.Runner.run")
+    async def test_detect_claims_batch_preserves_order(self, mock_runner_run, multiple_claims):
+        """Test that batch detection returns one claim list per text, in input order."""
+
+        async def run(agent, text):
+            claim = multiple_claims[0] if "first" in text else multiple_claims[2]
+            return MagicMock(final_output_as=MagicMock(return_value=[claim]))
+
+        mock_runner_run.side_effect = run
+        results = await ClaimDetector().detect_claims_batch(
+            ["This is the first text to check.", "This is the second text to check."]
+        )
+
+        assert [claims[0].text for claims in results] == [
+            multiple_claims[0].text,
+            multiple_claims[2].text,
+        ]
+
+    @pytest.mark.asyncio
+    @patch("verifact_agents.claim_detector.Runner.run")
+    async def test_detect_claims_batch_isolates_failures(self, mock_runner_run, single_claim):
+        """Test that an invalid text yields an empty list without failing the batch."""
+        setup_mock_agent_response(mock_runner_run, [single_claim])
+
+        results = await ClaimDetector().detect_claims_batch(["", VALID_LONG_ENOUGH_TEXT])
+
+        assert results == [[], [single_claim]]
+
+    @pytest.mark.asyncio
+    @patch("verifact_agents.claim_detector.Runner.run")
+    async def test_detect_claims_uses_cache(self, mock_runner_run, single_claim):
+        """Test that a detector with a cache runs the agent once per distinct text."""
+        setup_mock_agent_response(mock_runner_run, [single_claim])
+        detector = ClaimDetector(cache_size=8)
+
+        first = await detector.detect_claims(VALID_LONG_ENOUGH_TEXT)
+        second = await detector.detect_claims(VALID_LONG_ENOUGH_TEXT)
+
+        mock_runner_run.assert_called_once()
+        assert first == second == [single_claim]
+
     @pytest.mark.parametrize("invalid_input", ["", None, "Hi"])
     @pytest.mark.asyncio
     async def test_invalid_inputs(self, invalid_input):
@@ -244,6 +325,11 @@ class TestClaimDetector:
         assert isinstance(claims, list)
         mock_runner_run.assert_called_once()
 
+    def test_claim_is_immutable(self, single_claim):
+        """Test that claims cannot be modified after validation."""
+        with pytest.raises(ValidationError):
+            single_claim.text = "Something else entirely"
+
     def test_claim_text_sanitization(self):
         """Test that individual claim text is sanitized."""
         # Test HTML in claim text
@@ -4,6 +4,14 @@ from pathlib import Path
 
 from agents import Runner
 
+# Prefer orjson for writing results, but don't fail if it's not available
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from verifact_agents.claim_detector import Claim
 from verifact_agents.evidence_hunter import (
     Evidence,
@@ -13,6 +21,8 @@ from verifact_agents.evidence_hunter import (
 
 SAMPLED_CLAIMS_PATH = "data/testing_data/sampled_claims_with_wiki.json"
 EVIDENCE_RESULTS_PATH = "data/testing_data/evidence_hunter_results.json"
+# Number of claims searched at once; keeps the fan-out under the API rate limits
+MAX_CONCURRENT_CLAIMS = 10
 
 
 def load_sampled_claims(path):
@@ -28,6 +38,24 @@ def load_sampled_claims(path):
         return json.load(f)
 
 
+def save_results(results, path):
+    """Write results to a JSON file.
+
+    Args:
+        results (list[dict]): The results to write.
+        path (str): The path to the output JSON file.
+    """
+    if ORJSON_AVAILABLE:
+        content = orjson.dumps(results, option=orjson.OPT_INDENT_2)
+    else:
+        content = json.dumps(results, ensure_ascii=False, indent=2).encode("utf-8")
+    # Write to a temp file and swap it in, so an interrupted run never leaves truncated results
+    path = Path(path)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(content)
+    tmp_path.replace(path)
+
+
 def build_claim_objects(sampled_claims):
     """Build claim objects from sampled claims.
 
@@ -53,24 +81,24 @@ async def gather_evidence_for_claim(evidence_hunter, claim):
         return []
 
 
-async def run_evidence_hunter_on_claims(claims):
-    evidence_hunter = EvidenceHunter()
-    results = []
+async def run_evidence_hunter_on_claims(claims, evidence_hunter=None):
+    # Accept a shared hunter so repeated runs don't rebuild the agent and its tools
+    evidence_hunter = evidence_hunter or EvidenceHunter()
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_CLAIMS)
 
     async def process_claim(claim):
         try:
-            evidence = await gather_evidence_for_claim(evidence_hunter, claim)
+            async with semaphore:
+                evidence = await gather_evidence_for_claim(evidence_hunter, claim)
             return {
                 "claim": claim.text,
-                "evidence": [ev.dict() for ev in evidence] if evidence else [],
+                "evidence": [ev.model_dump() for ev in evidence] if evidence else [],
             }
         except Exception as e:
             return {"claim": claim.text, "evidence": [], "error": f"{e!s}"}
 
-    for claim in claims:
-        result = await process_claim(claim)
-        results.append(result)
-    return results
+    # gather preserves claim order, so results line up with the gold data for scoring
+    return await asyncio.gather(*(process_claim(claim) for claim in claims))
 
 
 if __name__ == "__main__":
@@ -81,5 +109,4 @@ if __name__ == "__main__":
 
     evidence_results = asyncio.run(run_evidence_hunter_on_claims(test_claims))
 
-    with Path(EVIDENCE_RESULTS_PATH).open("w", encoding="utf-8") as f:
-        json.dump(evidence_results, f, ensure_ascii=False, indent=2)
+    save_results(evidence_results, EVIDENCE_RESULTS_PATH)
@@ -0,0 +1,19 @@
+import asyncio
+
+from utils.search.search_tools import close_http_client, get_http_client
+
+
+async def _get_and_close_client():
+    client = get_http_client()
+    assert get_http_client() is client
+    await close_http_client()
+    return client
+
+
+def test_http_client_is_per_event_loop_and_closed_on_shutdown():
+    first = asyncio.run(_get_and_close_client())
+    second = asyncio.run(_get_and_close_client())
+
+    assert first is not second
+    assert first.is_closed
+    assert second.is_closed
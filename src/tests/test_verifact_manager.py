@@ -0,0 +1,370 @@
+"""Unit tests for the VerifactManager pipeline orchestration."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+from openai import RateLimitError
+from tenacity import wait_none
+
+from verifact_agents.claim_detector import Claim
+from verifact_agents.evidence_hunter import Evidence
+from verifact_agents.verdict_writer import Verdict
+from verifact_manager import VerifactManager
+
+TEST_TIMESTAMP = "2024-01-01T00:00:00+00:00"
+EXPECTED_UNCACHED_DETECTOR_CALLS = 2
+EXPECTED_CALLS_WITH_ONE_RETRY = 2
+
+
+def make_result(output):
+    """Helper to build a mocked Runner result."""
+    return MagicMock(final_output_as=MagicMock(return_value=output))
+
+
+@pytest.fixture
+def claims():
+    """Provide claims where only the first has evidence available."""
+    return [
+        Claim(text="Water boils at 100 degrees Celsius at sea level.", check_worthiness=0.9),
+        Claim(text="The Moon is made of cheese.", check_worthiness=0.8),
+    ]
+
+
+@pytest.fixture
+def evidence():
+    """Provide a single piece of evidence."""
+    return [
+        Evidence(
+            content="At sea level, water boils at 100 °C.",
+            source="https://example.com/boiling",
+            timestamp=TEST_TIMESTAMP,
+        )
+    ]
+
+
+@pytest.fixture
+def manager():
+    """Provide a manager with the search tools stubbed out."""
+    # The evidence hunter agent is built on first use, so keep the stub active for the test
+    with patch("verifact_agents.evidence_hunter.get_search_tools", return_value=[]):
+        yield VerifactManager()
+
+
+def make_rate_limit_error():
+    """Helper to build an OpenAI rate-limit error."""
+    request = httpx.Request("POST", "https://api.openai.com/v1/responses")
+    return RateLimitError(
+        "Rate limit reached", response=httpx.Response(429, request=request), body=None
+    )
+
+
+def make_verdict(claim_text, evidence):
+    """Helper to build a supporting verdict for a claim."""
+    return Verdict(
+        claim=claim_text,
+        verdict="true",
+        confidence=0.9,
+        explanation="Supported by evidence.",
+        sources=[evidence[0].source],
+    )
+
+
+def fake_runner(claims, evidence, batch_verdicts=None):
+    """Build a Runner.run side effect keyed on the agent being run.
+
+    Only the first claim gets evidence, unless batch_verdicts is given: then every claim
+    gets evidence and the batch verdict writer returns batch_verdicts.
+    """
+
+    async def run(agent, prompt, **kwargs):
+        if agent.name == "ClaimDetector":
+            return make_result(claims)
+        if agent.name == "EvidenceHunter":
+            has_evidence = batch_verdicts is not None or claims[0].text in prompt
+            return make_result(evidence if has_evidence else [])
+        if agent.name == "BatchVerdictWriter":
+            return make_result(batch_verdicts)
+        claim_text = next(claim.text for claim in claims if claim.text in prompt)
+        return make_result(make_verdict(claim_text, evidence))
+
+    return run
+
+
+class TestVerifactManager:
+    """Tests for the VerifactManager pipeline."""
+
+    @pytest.mark.asyncio
+    async def test_run_skips_claims_without_evidence(self, manager, claims, evidence):
+        """Test that only claims with evidence receive verdicts, in claim order."""
+        with patch("verifact_manager.Runner.run", side_effect=fake_runner(claims, evidence)):
+            verdicts = await manager.run("Some text to check for claims.")
+
+        assert len(verdicts) == 1
+        claim, claim_evidence, verdict = verdicts[0]
+        assert claim == claims[0]
+        assert claim_evidence == evidence
+        assert verdict.verdict == "true"
+
+    @pytest.mark.asyncio
+    async def test_run_returns_empty_list_without_claims(self, manager):
+        """Test that no further agents run when no claims are detected."""
+        with patch("verifact_manager.Runner.run", side_effect=fake_runner([], [])) as mock_run:
+            verdicts = await manager.run("Nothing to check here.")
+
+        assert verdicts == []
+        mock_run.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_run_reports_per_claim_progress_in_one_update(self, manager, claims, evidence):
+        """Test that per-claim progress lines are sent as a single update per stage."""
+        progress_callback = AsyncMock()
+        with patch("verifact_manager.Runner.run", side_effect=fake_runner(claims, evidence)):
+            await manager.run(
+                "Some text to check for claims.",
+                progress_callback=progress_callback,
+                progress_msg=MagicMock(),
+            )
+
+        updates = [call.args[1] for call in progress_callback.call_args_list]
+        gathering_updates = [u for u in updates if u.startswith("Gathering evidence")]
+        assert len(gathering_updates) == 1
+        assert gathering_updates[0].count("\n") == len(claims) - 1
+
+    @pytest.mark.asyncio
+    async def test_run_batches_verdicts_into_single_call(self, manager, claims, evidence):
+        """Test that batch_verdicts issues one verdict-writer call for all claims."""
+        manager.config.batch_verdicts = True
+        batch_verdicts = [make_verdict(claim.text, evidence) for claim in claims]
+        run = fake_runner(claims, evidence, batch_verdicts=batch_verdicts)
+
+        with patch("verifact_manager.Runner.run", side_effect=run) as mock_run:
+            verdicts = await manager.run("Some text to check for claims.")
+
+        agent_names = [call.args[0].name for call in mock_run.call_args_list]
+        assert agent_names.count("BatchVerdictWriter") == 1
+        assert "VerdictWriter" not in agent_names
+        assert [verdict for _, _, verdict in verdicts] == batch_verdicts
+
+    @pytest.mark.asyncio
+    async def test_run_matches_reordered_batch_verdicts_to_claims(self, manager, claims, evidence):
+        """Test that batched verdicts are attached to claims by text, not list position."""
+        manager.config.batch_verdicts = True
+        batch_verdicts = [make_verdict(claim.text, evidence) for claim in reversed(claims)]
+        run = fake_runner(claims, evidence, batch_verdicts=batch_verdicts)
+
+        with patch("verifact_manager.Runner.run", side_effect=run):
+            verdicts = await manager.run("Some text to check for claims.")
+
+        assert [(claim.text, verdict.claim) for claim, _, verdict in verdicts] == [
+            (claim.text, claim.text) for claim in claims
+        ]
+
+    @pytest.mark.asyncio
+    async def test_run_regenerates_only_unmatched_batch_verdicts(self, manager, claims, evidence):
+        """Test that only claims without a matching batched verdict get a per-claim verdict."""
+        manager.config.batch_verdicts = True
+        batch_verdicts = [
+            make_verdict(claims[0].text, evidence),
+            make_verdict("A reworded version of the second claim.", evidence),
+        ]
+        run = fake_runner(claims, evidence, batch_verdicts=batch_verdicts)
+
+        with patch("verifact_manager.Runner.run", side_effect=run) as mock_run:
+            verdicts = await manager.run("Some text to check for claims.")
+
+        verdict_prompts = [
+            call.args[1] for call in mock_run.call_args_list if call.args[0].name == "VerdictWriter"
+        ]
+        assert len(verdict_prompts) == 1
+        assert claims[1].text in verdict_prompts[0]
+        assert verdicts[0][2] is batch_verdicts[0]
+        assert [verdict.claim for _, _, verdict in verdicts] == [claim.text for claim in claims]
+
+    @pytest.mark.asyncio
+    async def test_run_skips_batch_call_for_single_claim_with_evidence(
+        self, manager, claims, evidence
+    ):
+        """Test that the batch writer is only used when several claims have evidence."""
+        manager.config.batch_verdicts = True
+        with patch(
+            "verifact_manager.Runner.run", side_effect=fake_runner(claims, evidence)
+        ) as mock_run:
+            verdicts = await manager.run("Some text to check for claims.")
+
+        agent_names = [call.args[0].name for call in mock_run.call_args_list]
+        assert "BatchVerdictWriter" not in agent_names
+        assert agent_names.count("VerdictWriter") == 1
+        assert len(verdicts) == 1
+
+    @pytest.mark.asyncio
+    async def test_run_serves_repeated_text_from_cache(self, manager, claims, evidence):
+        """Test that re-checking the same text reuses cached claims and verdicts."""
+        with patch(
+            "verifact_manager.Runner.run", side_effect=fake_runner(claims, evidence)
+        ) as mock_run:
+            first = await manager.run("Some text to check for claims.")
+            second = await manager.run("  some TEXT to check for claims. ")
+
+        agent_names = [call.args[0].name for call in mock_run.call_args_list]
+        assert agent_names.count("ClaimDetector") == 1
+        assert agent_names.count("VerdictWriter") == 1
+        # Empty evidence is not cached, so only the claim without evidence is searched again
+        assert agent_names.count("EvidenceHunter") == len(claims) + 1
+        assert second == first
+
+    @pytest.mark.asyncio
+    async def test_run_serves_batched_verdicts_from_cache(self, manager, claims, evidence):
+        """Test that the batch path reads and writes the per-claim verdict cache."""
+        manager.config.batch_verdicts = True
+        batch_verdicts = [make_verdict(claim.text, evidence) for claim in claims]
+        run = fake_runner(claims, evidence, batch_verdicts=batch_verdicts)
+
+        with patch("verifact_manager.Runner.run", side_effect=run) as mock_run:
+            first = await manager.run("Some text to check for claims.")
+            second = await manager.run("Some text to check for claims.")
+
+        agent_names = [call.args[0].name for call in mock_run.call_args_list]
+        assert agent_names.count("BatchVerdictWriter") == 1
+        assert "VerdictWriter" not in agent_names
+        assert second == first
+
+    @pytest.mark.asyncio
+    async def test_run_without_cache_calls_agents_again(self, manager, claims, evidence):
+        """Test that disabling the cache re-runs the agents."""
+        manager.config.enable_cache = False
+        with patch(
+            "verifact_manager.Runner.run", side_effect=fake_runner(claims, evidence)
+        ) as mock_run:
+            await manager.run("Some text to check for claims.")
+            calls_after_first_run = mock_run.call_count
+            await manager.run("Some text to check for claims.")
+
+        assert mock_run.call_count == 2 * calls_after_first_run
+
+    @pytest.mark.asyncio
+    async def test_run_use_cache_overrides_config_for_one_run(self, manager, claims, evidence):
+        """Test that use_cache=False bypasses the cache without changing the config."""
+        with patch(
+            "verifact_manager.Runner.run", side_effect=fake_runner(claims, evidence)
+        ) as mock_run:
+            await manager.run("Some text to check for claims.")
+            await manager.run("Some text to check for claims.", use_cache=False)
+
+        agent_names = [call.args[0].name for call in mock_run.call_args_list]
+        assert agent_names.count("ClaimDetector") == EXPECTED_UNCACHED_DETECTOR_CALLS
+        assert manager.config.enable_cache
+        assert manager.cache_enabled
+
+    @pytest.mark.asyncio
+    async def test_run_applies_max_claims(self, manager, claims, evidence):
+        """Test that max_claims is passed to the detector and enforced on its output."""
+        manager.config.max_claims = 1
+        with patch(
+            "verifact_manager.Runner.run", side_effect=fake_runner(claims, evidence)
+        ) as mock_run:
+            verdicts = await manager.run("Some text to check for claims.")
+
+        detector, detector_input = mock_run.call_args_list[0].args[:2]
+        assert detector_input == "Some text to check for claims."
+        assert "Return at most 1 claim," in detector.instructions
+        assert [claim for claim, _, _ in verdicts] == [claims[0]]
+        agent_names = [call.args[0].name for call in mock_run.call_args_list]
+        assert agent_names.count("EvidenceHunter") == 1
+
+    @pytest.mark.asyncio
+    async def test_run_does_not_reuse_claims_cached_under_other_max_claims(
+        self, manager, claims, evidence
+    ):
+        """Test that changing max_claims is not masked by cached, already-capped claims."""
+        manager.config.max_claims = 1
+        with patch(
+            "verifact_manager.Runner.run", side_effect=fake_runner(claims, evidence)
+        ) as mock_run:
+            await manager.run("Some text to check for claims.")
+            manager.config.max_claims = None
+            await manager.run("Some text to check for claims.")
+
+        agent_names = [call.args[0].name for call in mock_run.call_args_list]
+        assert agent_names.count("ClaimDetector") == EXPECTED_UNCACHED_DETECTOR_CALLS
+        evidence_prompts = [
+            call.args[1]
+            for call in mock_run.call_args_list
+            if call.args[0].name == "EvidenceHunter"
+        ]
+        assert any(claims[1].text in prompt for prompt in evidence_prompts)
+
+    @pytest.mark.asyncio
+    async def test_run_bounds_concurrent_claims_by_parallelism(self, manager, claims, evidence):
+        """Test that no more than `parallelism` claims are checked at once."""
+        manager.config.parallelism = 1
+        run = fake_runner(claims, evidence)
+        in_flight = max_in_flight = 0
+
+        async def tracking_run(agent, prompt, **kwargs):
+            nonlocal in_flight, max_in_flight
+            if agent.name != "EvidenceHunter":
+                return await run(agent, prompt, **kwargs)
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return await run(agent, prompt, **kwargs)
+
+        with patch("verifact_manager.Runner.run", side_effect=tracking_run):
+            verdicts = await manager.run("Some text to check for claims.")
+
+        assert max_in_flight == 1
+        assert len(verdicts) == 1
+
+    @patch("verifact_manager.LLM_CONCURRENCY", 1)
+    def test_run_under_contention_in_consecutive_event_loops(self, manager, claims, evidence):
+        """Test that the LLM concurrency limit works across separate event loops."""
+        run = fake_runner(claims, evidence)
+
+        async def yielding_run(agent, prompt, **kwargs):
+            await asyncio.sleep(0)
+            return await run(agent, prompt, **kwargs)
+
+        manager.config.enable_cache = False
+        with patch("verifact_manager.Runner.run", side_effect=yielding_run) as mock_run:
+            first = asyncio.run(manager.run("Some text to check for claims."))
+            second = asyncio.run(manager.run("Some text to check for claims."))
+
+        assert len(first) == len(second) == 1
+        agent_names = [call.args[0].name for call in mock_run.call_args_list]
+        assert agent_names.count("EvidenceHunter") == 2 * len(claims)
+
+    @pytest.mark.asyncio
+    @patch("verifact_manager.LLM_RETRY_WAIT", wait_none())
+    async def test_run_retries_rate_limited_agent_calls(self, manager, claims, evidence):
+        """Test that rate-limited agent runs are retried up to retry_attempts times."""
+        run = fake_runner(claims, evidence)
+        side_effects = [make_rate_limit_error(), make_result(claims)]
+
+        async def flaky_run(agent, prompt, **kwargs):
+            if agent.name == "ClaimDetector" and side_effects:
+                effect = side_effects.pop(0)
+                if isinstance(effect, Exception):
+                    raise effect
+                return effect
+            return await run(agent, prompt, **kwargs)
+
+        with patch("verifact_manager.Runner.run", side_effect=flaky_run):
+            verdicts = await manager.run("Some text to check for claims.")
+
+        assert len(verdicts) == 1
+
+    @pytest.mark.asyncio
+    @patch("verifact_manager.LLM_RETRY_WAIT", wait_none())
+    async def test_run_gives_up_after_retry_attempts(self, manager):
+        """Test that the rate-limit error is raised once retries are exhausted."""
+        manager.config.retry_attempts = 1
+        with (
+            patch("verifact_manager.Runner.run", side_effect=make_rate_limit_error()) as mock_run,
+            pytest.raises(RateLimitError),
+        ):
+            await manager.run("Some text to check for claims.")
+
+        assert mock_run.call_count == EXPECTED_CALLS_WITH_ONE_RETRY
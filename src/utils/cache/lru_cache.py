@@ -0,0 +1,93 @@
+"""In-process caching utilities for VeriFact.
+
+This module provides a small bounded LRU cache and helpers for building stable
+cache keys from claim text, so repeated fact-checks of the same text can skip
+the LLM pipeline.
+"""
+
+import hashlib
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text for cache lookups by lowercasing and collapsing whitespace.
+
+    Args:
+        text (str): The text to normalize.
+
+    Returns:
+        str: The normalized text.
+    """
+    return " ".join(text.lower().split())
+
+
+# A claim's key is needed for both its evidence and verdict entries, so memoize it
+@lru_cache(maxsize=1024)
+def text_cache_key(text: str) -> str:
+    """Build a stable cache key from text.
+
+    Args:
+        text (str): The text to build a key for.
+
+    Returns:
+        str: The hex digest of the normalized text.
+    """
+    return hashlib.blake2b(normalize_text(text).encode("utf-8"), digest_size=16).hexdigest()
+
+
+class LRUCache:
+    """A bounded mapping that evicts the least recently used entry when full."""
+
+    def __init__(self, maxsize: int = 1024):
+        """Initialize the cache.
+
+        Args:
+            maxsize (int): Maximum number of entries to keep.
+        """
+        if maxsize < 1:
+            error_msg = "maxsize must be at least 1"
+            raise ValueError(error_msg)
+        self.maxsize = maxsize
+        self._data: OrderedDict[str, Any] = OrderedDict()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a cached value and mark it as recently used.
+
+        Args:
+            key (str): The cache key.
+            default (Any): Value returned when the key is not cached.
+
+        Returns:
+            Any: The cached value, or default on a miss.
+        """
+        try:
+            self._data.move_to_end(key)
+        except KeyError:
+            return default
+        return self._data[key]
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if the cache is full.
+
+        Args:
+            key (str): The cache key.
+            value (Any): The value to cache.
+        """
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        self._data.clear()
+
+    def __contains__(self, key: str) -> bool:
+        """Check whether a key is cached without updating its recency."""
+        return key in self._data
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._data)
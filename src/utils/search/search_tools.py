@@ -4,8 +4,10 @@ This module provides utilities for searching the web for information using
 multiple search providers with the OpenAI Agents SDK.
 """
 
+import asyncio
 import logging
 import os
+import weakref
 from typing import Any
 
 import httpx
@@ -15,6 +17,38 @@ from agents import WebSearchTool, function_tool
 logger = logging.getLogger(__name__)
 
 
+# httpx pools connections on the loop that opened them, so keep one client per event loop
+_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client used for search API requests.
+
+    Reusing one pooled client keeps connections alive between searches instead of
+    paying a new TCP/TLS handshake for every query.
+
+    Returns:
+        The httpx.AsyncClient instance for the running event loop.
+    """
+    loop = asyncio.get_running_loop()
+    client = _http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = _http_clients[loop] = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+    return client
+
+
+async def close_http_client() -> None:
+    """Close the running event loop's shared HTTP client, if one was created."""
+    client = _http_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
 def _parse_serper_results(
     data: dict[str, Any], search_type: str, num_results: int
 ) -> list[dict[str, Any]]:
@@ -71,10 +105,10 @@ async def serper_search(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(f"{api_url}{endpoint}", headers=headers, json=payload)
-            response.raise_for_status()
-            data = response.json()
+        client = get_http_client()
+        response = await client.post(f"{api_url}{endpoint}", headers=headers, json=payload)
+        response.raise_for_status()
+        data = response.json()
     except httpx.HTTPStatusError as e:
         logger.exception("Serper API error: %s - %s", e.response.status_code, e.response.text)
         return [{"error": f"API returned status code {e.response.status_code}"}]
@@ -4,12 +4,16 @@ This module provides a streamlined claim detection system that uses AI agents
 for intelligent analysis instead of complex rule-based processing.
 """
 
+import asyncio
 import html
 import logging
 import re
+from functools import lru_cache
 
 from agents import Agent, Runner, function_tool
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from utils.cache.lru_cache import LRUCache, text_cache_key
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -21,6 +25,13 @@ MIN_TEXT_LENGTH = 10
 MAX_CLAIM_TEXT_LENGTH = 150
 MAX_CONTEXT_LENGTH = 200
 MAX_CLAIMS_PER_REQUEST = 2
+# Function words ignored when comparing claims; negations are deliberately left out
+CLAIM_STOPWORDS = frozenset(
+    {"a", "an", "the", "of", "in", "on", "at", "to", "for", "by", "with", "and", "or"}
+    | {"is", "are", "was", "were", "be", "been", "has", "have", "had", "that", "this"}
+)
+# Words up to this length keep a trailing "s" (e.g. "gas", "has") when comparing claims
+MIN_PLURAL_LENGTH = 3
 DANGEROUS_PATTERNS = [
     r"<script.*?</script>",  # Script tags
     r"javascript:",  # JavaScript protocol
@@ -32,10 +43,26 @@ DANGEROUS_PATTERNS = [
     r"<embed.*?</embed>",  # Embed tags
 ]
 
-PROMPT = """
+# Compiled once at import; these run on every claim and every preprocessed text
+_DANGEROUS_PATTERNS_RE = re.compile(
+    "|".join(f"(?:{pattern})" for pattern in DANGEROUS_PATTERNS), flags=re.IGNORECASE | re.DOTALL
+)
+_CONTROL_CHARS_RE = re.compile(r"[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]")
+_DOUBLE_QUOTES_RE = re.compile(r'["""]')
+_SINGLE_QUOTES_RE = re.compile(r"[''']")
+_DASHES_RE = re.compile(r"[—-]")
+_FILLER_WORDS_RE = re.compile(r"\b(um|uh|er|ah)\b", flags=re.IGNORECASE)
+# Numbers (with decimal or thousands separators) and words, for claim comparison
+_CLAIM_TOKEN_RE = re.compile(r"\d+(?:[.,]\d+)*|[a-z]+")
+ABBREVIATIONS = {"vs.": "versus", "etc.": "etcetera"}
+_ABBREVIATIONS_RE = re.compile(
+    r"\b(?:" + "|".join(re.escape(abbr) for abbr in ABBREVIATIONS) + ")", flags=re.IGNORECASE
+)
+
+PROMPT = f"""
 You are an intelligent claim detection agent designed to identify factual claims from text that require verification.
 
-IMPORTANT: Due to system constraints, you can only return a maximum of 2 claims per request. Focus on the most important and check-worthy claims.
+IMPORTANT: Due to system constraints, you can only return a maximum of {MAX_CLAIMS_PER_REQUEST} claims per request. Focus on the most important and check-worthy claims.
 
 Your task is to analyze input text and identify factual claims that should be fact-checked. You must distinguish between:
 - FACTUAL CLAIMS: Statements that make specific, verifiable assertions about reality
@@ -132,6 +159,9 @@ def _validate_text_input(
 class Claim(BaseModel):
     """A factual claim that requires verification."""
 
+    # Claims are shared between cached results and concurrent pipeline runs, so keep them immutable
+    model_config = ConfigDict(frozen=True)
+
     text: str
     context: str = Field(default="")
     check_worthiness: float = Field(default=0.0, ge=0.0, le=1.0)
@@ -163,17 +193,19 @@ class Claim(BaseModel):
         return v
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _sanitize_text(text: str) -> str:
         """Sanitize text to remove potentially dangerous content."""
         # HTML escape
         text = html.escape(text)
 
         # Remove dangerous patterns
-        for pattern in DANGEROUS_PATTERNS:
-            text = re.sub(pattern, "", text, flags=re.IGNORECASE | re.DOTALL)
+        # One pass over all patterns, repeated until removing a match exposes no new one
+        while (stripped := _DANGEROUS_PATTERNS_RE.sub("", text)) != text:
+            text = stripped
 
         # Remove control characters except newlines and tabs
-        text = re.sub(r"[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]", "", text)
+        text = _CONTROL_CHARS_RE.sub("", text)
 
         # Normalize whitespace
         return " ".join(text.split())
@@ -199,12 +231,69 @@ class Claim(BaseModel):
         return self.confidence >= threshold
 
 
+def _claim_content_key(text: str) -> tuple[str, ...]:
+    """Reduce claim text to its numbers and content words for duplicate detection.
+
+    Punctuation, stopwords and plural endings are dropped, while numbers and
+    negations are kept, so claims that differ in a figure or a "not" stay distinct.
+    """
+    text = html.unescape(text).lower().replace("n't", " not").replace("%", " percent")
+    key = []
+    for token in _CLAIM_TOKEN_RE.findall(text):
+        if token in CLAIM_STOPWORDS:
+            continue
+        is_plural = (
+            len(token) > MIN_PLURAL_LENGTH and token.endswith("s") and not token.endswith("ss")
+        )
+        key.append(token[:-1] if is_plural else token)
+    return tuple(key)
+
+
+def deduplicate_claims(claims: list[Claim]) -> list[Claim]:
+    """Remove duplicate claims, including rewordings with the same numbers and content words.
+
+    Args:
+        claims: List of claims to deduplicate
+
+    Returns:
+        List of deduplicated claims, sorted by check-worthiness (highest first)
+    """
+    if not claims:
+        return claims
+
+    # Sort by check-worthiness (highest first) to prioritize more important claims
+    # when duplicates are found
+    sorted_claims = sorted(claims, key=lambda x: x.check_worthiness, reverse=True)
+
+    unique_claims = []
+    seen_keys = set()
+
+    for claim in sorted_claims:
+        content_key = _claim_content_key(claim.text)
+
+        # Skip claims with no content and ones already seen
+        if not content_key or content_key in seen_keys:
+            continue
+
+        unique_claims.append(claim)
+        seen_keys.add(content_key)
+
+    logger.info("Deduplicated claims: %d -> %d", len(claims), len(unique_claims))
+    return unique_claims
+
+
 class ClaimDetector:
     """AI-driven claim detection system that replaces complex rule-based processing."""
 
-    def __init__(self):
-        """Initialize the claim detector with AI agent."""
+    def __init__(self, cache_size: int | None = None):
+        """Initialize the claim detector with AI agent.
+
+        Args:
+            cache_size: Number of texts whose detected claims are kept in memory, or None
+                to call the agent for every text
+        """
         self.agent = claim_detector_agent
+        self.cache = LRUCache(cache_size) if cache_size else None
 
     def _normalize_whitespace(self, text: str) -> str:
         """Normalize whitespace: replace multiple spaces/tabs/newlines with single space."""
@@ -219,16 +308,15 @@ class ClaimDetector:
         text = self._normalize_whitespace(text)
 
         # Normalize quotes and dashes
-        text = re.sub(r'["""]', '"', text)
-        text = re.sub(r"[''']", "'", text)
-        text = re.sub(r"[—-]", " ", text)
+        text = _DOUBLE_QUOTES_RE.sub('"', text)
+        text = _SINGLE_QUOTES_RE.sub("'", text)
+        text = _DASHES_RE.sub(" ", text)
 
         # Remove common noise patterns
-        text = re.sub(r"\b(um|uh|er|ah)\b", "", text, flags=re.IGNORECASE)
+        text = _FILLER_WORDS_RE.sub("", text)
 
         # Normalize common abbreviations
-        text = re.sub(r"\bvs\.", "versus", text, flags=re.IGNORECASE)
-        text = re.sub(r"\betc\.", "etcetera", text, flags=re.IGNORECASE)
+        text = _ABBREVIATIONS_RE.sub(lambda m: ABBREVIATIONS[m.group(0).lower()], text)
 
         # Final cleanup after all substitutions
         return self._normalize_whitespace(text)
@@ -242,30 +330,7 @@ class ClaimDetector:
         Returns:
             List of deduplicated claims, sorted by check-worthiness (highest first)
         """
-        if not claims:
-            return claims
-
-        # Sort by check-worthiness (highest first) to prioritize more important claims
-        # when duplicates are found
-        sorted_claims = sorted(claims, key=lambda x: x.check_worthiness, reverse=True)
-
-        unique_claims = []
-        seen_texts = set()
-
-        for claim in sorted_claims:
-            normalized_text = claim.text.lower().strip()
-
-            # Skip empty normalized text
-            if not normalized_text:
-                continue
-
-            # Only consider exact matches as duplicates
-            if normalized_text not in seen_texts:
-                unique_claims.append(claim)
-                seen_texts.add(normalized_text)
-
-        logger.info("Deduplicated claims: %d -> %d", len(claims), len(unique_claims))
-        return unique_claims
+        return deduplicate_claims(claims)
 
     async def detect_claims(self, text: str, min_checkworthiness: float = 0.5) -> list[Claim]:
         """Detect claims in text using AI agent analysis."""
@@ -279,14 +344,24 @@ class ClaimDetector:
                 logger.warning("Text too short for meaningful claim detection")
                 return []
 
-            # Use AI agent to analyze and extract claims
-            result = await Runner.run(self.agent, cleaned_text)
-            claims = result.final_output_as(list[Claim])
-
-            # Limit number of claims returned
-            if len(claims) > MAX_CLAIMS_PER_REQUEST:
-                logger.warning("Too many claims detected, limiting to %d", MAX_CLAIMS_PER_REQUEST)
-                claims = claims[:MAX_CLAIMS_PER_REQUEST]
+            cache_key = text_cache_key(cleaned_text)
+            claims = self.cache.get(cache_key) if self.cache is not None else None
+            if claims is not None:
+                logger.info("Using cached claims for text")
+            else:
+                # Use AI agent to analyze and extract claims
+                result = await Runner.run(self.agent, cleaned_text)
+                claims = result.final_output_as(list[Claim])
+
+                # Limit number of claims returned
+                if len(claims) > MAX_CLAIMS_PER_REQUEST:
+                    logger.warning(
+                        "Too many claims detected, limiting to %d", MAX_CLAIMS_PER_REQUEST
+                    )
+                    claims = claims[:MAX_CLAIMS_PER_REQUEST]
+
+                if self.cache is not None:
+                    self.cache.set(cache_key, claims)
 
             # Filter by minimum check-worthiness
             filtered_claims = [
@@ -304,12 +379,62 @@ class ClaimDetector:
         else:
             return final_claims
 
+    async def detect_claims_batch(
+        self, texts: list[str], min_checkworthiness: float = 0.5
+    ) -> list[list[Claim]]:
+        """Detect claims in several texts concurrently.
+
+        Args:
+            texts: Texts to analyze
+            min_checkworthiness: Minimum check-worthiness for returned claims
+
+        Returns:
+            One list of claims per input text, in the same order as the texts. A text
+            that fails detection (e.g. invalid input) gets an empty list, so one bad
+            text does not discard the rest of the batch.
+        """
+        results = await asyncio.gather(
+            *(self.detect_claims(text, min_checkworthiness) for text in texts),
+            return_exceptions=True,
+        )
+        batch = []
+        for index, result in enumerate(results):
+            if isinstance(result, Exception):
+                # detect_claims has already logged the traceback
+                logger.warning("Claim detection failed for text %d in batch: %s", index, result)
+                batch.append([])
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                batch.append(result)
+        return batch
+
 
 # Create the agent instance as a constant (like the original)
 claim_detector_agent = Agent(
     name="ClaimDetector", instructions=PROMPT, output_type=list[Claim], model="gpt-4o-mini"
 )
 
+
+@lru_cache(maxsize=16)
+def get_claim_detector_agent(max_claims: int | None = None) -> Agent:
+    """Get the claim detector agent, instructed to return at most max_claims claims.
+
+    Args:
+        max_claims: Maximum number of claims to ask for, or None for no limit
+
+    Returns:
+        The shared agent when there is no limit, otherwise a clone with the limit
+        added to its instructions
+    """
+    if max_claims is None:
+        return claim_detector_agent
+    noun = "claim" if max_claims == 1 else "claims"
+    return claim_detector_agent.clone(
+        instructions=f"{PROMPT}\nReturn at most {max_claims} {noun}, the most check-worthy first."
+    )
+
+
 # Create singleton instance
 claim_detector = ClaimDetector()
 
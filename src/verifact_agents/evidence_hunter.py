@@ -2,7 +2,8 @@
 
 import logging
 import os
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import cached_property
 from pathlib import Path
 
 from agents import Agent, WebSearchTool
@@ -22,7 +23,7 @@ class Evidence(BaseModel):
     relevance: float = 1.0
     stance: str = "supporting"  # supporting, contradicting, neutral
     credibility: float = 1.0
-    timestamp: str = Field(default_factory=lambda: datetime.now(datetime.timezone.utc).isoformat())
+    timestamp: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
 
 
 def deduplicate_evidence(evidence_list: list[Evidence]) -> list[Evidence]:
@@ -68,7 +69,9 @@ class EvidenceHunter:
     """Evidence hunter agent that searches for evidence to support or refute claims."""
 
     def __init__(
-        self, trust_sources_path: str = "data/trust_sources.txt", search_tools: list[str] | None = None
+        self,
+        trust_sources_path: str = "data/trust_sources.txt",
+        search_tools: list[str] | None = None,
     ):
         """Initialize the evidence hunter.
 
@@ -78,15 +81,19 @@ class EvidenceHunter:
         """
         self.trust_sources = get_trust_sources(trust_sources_path)
         self.use_serper = os.getenv("USE_SERPER", "false").lower() == "true"
+        self.search_tools = search_tools
 
+    @cached_property
+    def evidence_hunter_agent(self) -> Agent:
+        """The evidence hunter agent, built on first use rather than at construction."""
         prompt = self.get_prompt(self.trust_sources)
 
-        tools = get_search_tools(search_tools)
+        tools = get_search_tools(self.search_tools)
         if not tools:
             logger.warning("No search tools available, using default WebSearchTool")
             tools = [WebSearchTool()]
 
-        self.evidence_hunter_agent = Agent(
+        return Agent(
             name="EvidenceHunter",
             instructions=prompt,
             output_type=list[Evidence],
@@ -14,7 +14,9 @@ class Verdict(BaseModel):
     )
     confidence: float = Field(description="Confidence in the verdict (0-1)", ge=0.0, le=1.0)
     explanation: str = Field(description="Detailed explanation of the verdict with reasoning")
-    sources: list[str] = Field(description="List of sources used to reach the verdict", min_items=1)
+    sources: list[str] = Field(
+        description="List of sources used to reach the verdict", min_length=1
+    )
 
 
 PROMPT = """
@@ -71,3 +73,21 @@ verdict_writer_agent = Agent(
     tools=[],
     model=os.getenv("VERDICT_WRITER_MODEL"),
 )
+
+BATCH_PROMPT = (
+    PROMPT
+    + """
+You may be given several numbered claims at once, each with its own evidence.
+Assess every claim independently using only the evidence listed under it, and
+return one verdict per claim in the same order as the claims were given. Copy each
+claim's text into its verdict's `claim` field exactly as it was given.
+"""
+)
+
+batch_verdict_writer_agent = Agent(
+    name="BatchVerdictWriter",
+    instructions=BATCH_PROMPT,
+    output_type=list[Verdict],
+    tools=[],
+    model=os.getenv("VERDICT_WRITER_MODEL"),
+)
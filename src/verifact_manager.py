@@ -10,21 +10,84 @@ and provides both synchronous and asynchronous operation modes.
 """
 
 import asyncio
+import html
 import logging
+import os
+import weakref
+from contextlib import contextmanager
+from contextvars import ContextVar
 
-from agents import Runner, gen_trace_id, trace
+from agents import Agent, Runner, gen_trace_id, trace
+from openai import RateLimitError
 from pydantic import BaseModel, Field
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
 
-from verifact_agents.claim_detector import Claim, claim_detector_agent
+from utils.cache.lru_cache import LRUCache, normalize_text, text_cache_key
+from verifact_agents.claim_detector import Claim, deduplicate_claims, get_claim_detector_agent
 from verifact_agents.evidence_hunter import (
     Evidence,
     EvidenceHunter,
     deduplicate_evidence,
 )
-from verifact_agents.verdict_writer import Verdict, verdict_writer_agent
+from verifact_agents.verdict_writer import (
+    Verdict,
+    batch_verdict_writer_agent,
+    verdict_writer_agent,
+)
 
 logger = logging.getLogger(__name__)
 
+# Caps concurrent agent runs across all pipelines in this process so claim fan-out
+# stays under the provider's rate limits instead of bursting into 429s
+LLM_CONCURRENCY = int(os.getenv("VERIFACT_LLM_CONCURRENCY", "20"))
+LLM_RETRY_WAIT = wait_exponential_jitter(initial=1, max=30)
+# asyncio semaphores bind to the loop that first waits on them, so keep one per event loop
+_llm_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_llm_semaphore() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    semaphore = _llm_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _llm_semaphores[loop] = asyncio.Semaphore(LLM_CONCURRENCY)
+    return semaphore
+
+
+# Per-run cache override; a context variable keeps concurrent runs from seeing each other's flag
+_use_cache: ContextVar[bool | None] = ContextVar("verifact_use_cache", default=None)
+
+
+@contextmanager
+def _cache_scope(use_cache: bool | None):
+    token = _use_cache.set(use_cache)
+    try:
+        yield
+    finally:
+        _use_cache.reset(token)
+
+
+def _verdict_cache_key(claim: Claim, evidence: list[Evidence]) -> str:
+    # Key on the evidence as well so a verdict is recomputed when the evidence changes
+    evidence_key = text_cache_key("\n".join(f"{ev.source}\t{ev.content}" for ev in evidence))
+    return f"verdict:{text_cache_key(claim.text)}:{evidence_key}"
+
+
+def _claim_match_key(text: str) -> str:
+    # Claim texts are HTML-escaped on validation, but the model may echo them unescaped
+    return normalize_text(html.unescape(text))
+
+
+async def _bounded(semaphore: asyncio.Semaphore, coro):
+    async with semaphore:
+        return await coro
+
 
 class ManagerConfig(BaseModel):
     """Configuration options for the factcheck pipeline."""
@@ -37,29 +100,47 @@ class ManagerConfig(BaseModel):
     retry_attempts: int = 2
     raise_exceptions: bool = False
     include_debug_info: bool = False
+    batch_verdicts: bool = False
+    parallelism: int = Field(5, ge=1)
+    enable_cache: bool = True
+    cache_size: int = Field(1024, ge=1)
 
 
 class VerifactManager:
     """Orchestrates the full fact-checking pipeline."""
 
-    def __init__(self, config: ManagerConfig = None):
-        """Initialize VeriFact manager with optional configuration."""
-        self.config = config or ManagerConfig()
-        self.evidence_hunter = EvidenceHunter()
+    def __init__(self, config: ManagerConfig = None, evidence_hunter: EvidenceHunter | None = None):
+        """Initialize VeriFact manager with optional configuration.
 
-    async def run(self, query: str, progress_callback=None, progress_msg=None) -> None:
+        Args:
+            config (ManagerConfig): Pipeline configuration options.
+            evidence_hunter (EvidenceHunter): Optional evidence hunter to share between
+                managers instead of building a new agent per manager.
+        """
+        self.config = config or ManagerConfig()
+        self.evidence_hunter = evidence_hunter or EvidenceHunter()
+        self.cache = LRUCache(self.config.cache_size)
+
+    async def run(
+        self,
+        query: str,
+        progress_callback=None,
+        progress_msg=None,
+        use_cache: bool | None = None,
+    ) -> None:
         """Process text through the full factchecking pipeline.
 
         Args:
             query (str): The text to factcheck.
             progress_callback: Optional function to call with progress messages
             progress_msg: The Chainlit message object to update
+            use_cache (bool): Override ``config.enable_cache`` for this run only.
 
         Returns:
             List[Verdict]: A list of verdicts for claims in the text
         """
         trace_id = gen_trace_id()
-        with trace("VeriFact trace", trace_id=trace_id):
+        with trace("VeriFact trace", trace_id=trace_id), _cache_scope(use_cache):
             logger.info("Starting factchecking pipeline for trace %s...", trace_id)
             if progress_callback and progress_msg:
                 await progress_callback(progress_msg, "Starting factchecking pipeline...")
@@ -83,100 +164,130 @@ class VerifactManager:
             except Exception as e:
                 logger.exception("Error in claim detection")
                 if progress_callback and progress_msg:
-                    await progress_callback(progress_msg, f"Error in claim detection: {e!s}")
+                    await progress_callback(
+                        progress_msg, f"Error in claim detection: {type(e).__name__}"
+                    )
                 raise
 
-            # Step 2: Gather evidence for each claim (with parallelism)
+            # Step 2: Gather evidence and generate a verdict for every claim concurrently
             try:
-                claim_evidence_pairs = []
-                for idx, claim in enumerate(claims):
-                    if progress_callback and progress_msg:
-                        await progress_callback(
-                            progress_msg,
-                            f"Gathering evidence for claim {idx + 1}/{len(claims)}: '{getattr(claim, 'text', str(claim))[:60]}'...",
-                        )
-                    try:
-                        evidence = await self._gather_evidence_for_claim(claim)
-                    except Exception:
-                        evidence = None
-                    claim_evidence_pairs.append((claim, evidence))
                 if progress_callback and progress_msg:
+                    # One update for all claims rather than a UI round-trip per claim
                     await progress_callback(
-                        progress_msg, "Evidence gathering complete. Generating verdicts..."
+                        progress_msg,
+                        "\n".join(
+                            f"Gathering evidence for claim {idx + 1}/{len(claims)}: '{claim.text[:60]}'..."
+                            for idx, claim in enumerate(claims)
+                        ),
+                    )
+                if self.config.batch_verdicts and len(claims) > 1:
+                    results = await self._check_claims_batched(claims)
+                else:
+                    semaphore = asyncio.Semaphore(self.config.parallelism)
+                    results = await asyncio.gather(
+                        *(_bounded(semaphore, self._check_claim(claim)) for claim in claims)
                     )
             except Exception as e:
-                logger.exception("Error in evidence gathering")
+                logger.exception("Error in claim verification")
                 if progress_callback and progress_msg:
-                    await progress_callback(progress_msg, f"Error in evidence gathering: {e!s}")
+                    await progress_callback(
+                        progress_msg, f"Error in claim verification: {type(e).__name__}"
+                    )
                 raise
 
-            # Step 3: Generate verdicts for each claim
-            try:
-                verdicts = []
-                for idx, (claim, evidence) in enumerate(claim_evidence_pairs):
-                    if not evidence:
-                        logger.warning("Skipping claim - no evidence found")
-                        if progress_callback and progress_msg:
-                            await progress_callback(
-                                progress_msg,
-                                f"No evidence found for claim {idx + 1}: '{getattr(claim, 'text', str(claim))[:60]}'. Skipping verdict.",
-                            )
-                        continue
-                    if progress_callback and progress_msg:
-                        await progress_callback(
-                            progress_msg, f"Generating verdict for claim {idx + 1}/{len(claims)}..."
-                        )
-                    verdict = await self._generate_verdict_for_claim(claim, evidence)
-                    verdicts.append((claim, evidence, verdict))
-                if progress_callback and progress_msg:
-                    await progress_callback(progress_msg, "Factchecking pipeline completed.")
-            except Exception as e:
-                logger.exception("Error in verdict generation")
-                if progress_callback and progress_msg:
-                    await progress_callback(progress_msg, f"Error in verdict generation: {e!s}")
-                raise
+            verdicts = []
+            skipped_updates = []
+            for idx, (claim, evidence, verdict) in enumerate(results):
+                if verdict is None:
+                    skipped_updates.append(
+                        f"No evidence found for claim {idx + 1}: '{claim.text[:60]}'. Skipping verdict."
+                    )
+                    continue
+                verdicts.append((claim, evidence, verdict))
+            if progress_callback and progress_msg:
+                if skipped_updates:
+                    await progress_callback(progress_msg, "\n".join(skipped_updates))
+                await progress_callback(progress_msg, "Factchecking pipeline completed.")
 
             logger.info("Factchecking pipeline completed. Generated %d verdicts.", len(verdicts))
             return verdicts
 
+    @property
+    def cache_enabled(self) -> bool:
+        """Whether the current run reads and writes the result cache."""
+        use_cache = _use_cache.get()
+        return self.config.enable_cache if use_cache is None else use_cache
+
+    async def _run_agent(self, agent: Agent, agent_input: str, **kwargs):
+        """Run an agent under the shared concurrency limit, retrying on rate limits."""
+        async for attempt in AsyncRetrying(
+            retry=retry_if_exception_type(RateLimitError),
+            wait=LLM_RETRY_WAIT,
+            stop=stop_after_attempt(self.config.retry_attempts + 1),
+            reraise=True,
+        ):
+            with attempt:
+                async with _get_llm_semaphore():
+                    result = await Runner.run(agent, agent_input, **kwargs)
+        return result
+
     async def _detect_claims(self, text: str) -> list[Claim]:
-        logger.info("Detecting claims...")
-        result = await Runner.run(claim_detector_agent, text)
+        # Cached claims are already capped, so the cap must be part of the key
+        cache_key = f"claims:{self.config.max_claims}:{text_cache_key(text)}"
+        if self.cache_enabled and (cached := self.cache.get(cache_key)) is not None:
+            logger.info("Using cached claims (%d)", len(cached))
+            return list(cached)
 
-        claims = result.final_output_as(list[Claim])
+        logger.info("Detecting claims...")
+        # Ask for fewer claims up front so the model spends fewer output tokens
+        agent = get_claim_detector_agent(self.config.max_claims)
+        result = await self._run_agent(agent, text)
+
+        # Drop near-duplicate claims before paying for evidence and verdicts on each
+        claims = deduplicate_claims(result.final_output_as(list[Claim]))
+        if self.config.max_claims is not None:
+            claims = claims[: self.config.max_claims]
         logger.info("Detected %d claims", len(claims))
 
+        if self.cache_enabled:
+            self.cache.set(cache_key, list(claims))
         return claims
 
     async def _gather_evidence_for_claim(self, claim: Claim) -> list[Evidence]:
+        cache_key = f"evidence:{text_cache_key(claim.text)}"
+        if self.cache_enabled and (cached := self.cache.get(cache_key)) is not None:
+            logger.info("Using cached evidence for claim %s", claim.text[:50])
+            return list(cached)
+
         logger.info("Gathering evidence for claim %s...", claim.text[:50])
 
         query = self.evidence_hunter.query_formulation(claim)
 
         try:
-            result = await Runner.run(
+            result = await self._run_agent(
                 self.evidence_hunter.evidence_hunter_agent, query, max_turns=10
             )
-            logger.info("Evidence gathered for claim: %s", result)
+            logger.debug("Evidence gathered for claim: %s", result)
         except Exception:
             logger.exception("Error running evidence_hunter_agent")
             result = None
 
-        evidences = result.final_output_as(list[Evidence])
-        return deduplicate_evidence(evidences)
+        evidences = deduplicate_evidence(result.final_output_as(list[Evidence]))
+        if self.cache_enabled and evidences:
+            self.cache.set(cache_key, list(evidences))
+        return evidences
 
     async def _gather_evidence(
         self, claims: list[Claim]
     ) -> list[tuple[Claim, list[Evidence] | None]]:
-        tasks = [self._gather_evidence_for_claim(claim) for claim in claims]
+        semaphore = asyncio.Semaphore(self.config.parallelism)
+        tasks = [_bounded(semaphore, self._gather_evidence_for_claim(claim)) for claim in claims]
         results = await asyncio.gather(*tasks, return_exceptions=True)
         claim_evidence_pairs = []
 
         for claim, result in zip(claims, results, strict=False):
             if isinstance(result, Exception):
-                logger.error(
-                    "Error gathering evidence for claim: %s: %s", claim.text[:50], result.message
-                )
+                logger.error("Error gathering evidence for claim: %s: %s", claim.text[:50], result)
                 claim_evidence_pairs.append((claim, None))
             elif result is None:
                 logger.warning("No evidence found for claim: %s", claim.text[:50])
@@ -186,7 +297,46 @@ class VerifactManager:
 
         return claim_evidence_pairs
 
+    async def _check_claim(
+        self, claim: Claim
+    ) -> tuple[Claim, list[Evidence] | None, Verdict | None]:
+        """Gather evidence for one claim and, if any is found, generate its verdict."""
+        try:
+            evidence = await self._gather_evidence_for_claim(claim)
+        except Exception:
+            logger.exception("Error gathering evidence for claim: %s", claim.text[:50])
+            evidence = None
+
+        if not evidence:
+            logger.warning("Skipping claim - no evidence found")
+            return claim, evidence, None
+
+        return claim, evidence, await self._generate_verdict_for_claim(claim, evidence)
+
+    async def _check_claims_batched(
+        self, claims: list[Claim]
+    ) -> list[tuple[Claim, list[Evidence] | None, Verdict | None]]:
+        """Gather evidence for all claims, then generate their verdicts in one call."""
+        claim_evidence_pairs = await self._gather_evidence(claims)
+        pairs_with_evidence = [
+            (claim, evidence) for claim, evidence in claim_evidence_pairs if evidence
+        ]
+        if not pairs_with_evidence:
+            logger.warning("Skipping claims - no evidence found")
+            return [(claim, evidence, None) for claim, evidence in claim_evidence_pairs]
+
+        verdicts = iter(await self._generate_verdicts_batch(pairs_with_evidence))
+        return [
+            (claim, evidence, next(verdicts) if evidence else None)
+            for claim, evidence in claim_evidence_pairs
+        ]
+
     async def _generate_verdict_for_claim(self, claim: Claim, evidence: list[Evidence]) -> Verdict:
+        cache_key = _verdict_cache_key(claim, evidence)
+        if self.cache_enabled and (cached := self.cache.get(cache_key)) is not None:
+            logger.info("Using cached verdict for claim %s", claim.text[:50])
+            return cached
+
         logger.info("Generating verdict for claim %s...", claim.text[:50])
         # TODO: add formatting of evidence and citations before creating the prompt
 
@@ -195,28 +345,99 @@ class VerifactManager:
         Evidence: {evidence}
         """
 
-        result = await Runner.run(verdict_writer_agent, prompt)
-        return result.final_output_as(Verdict)
+        result = await self._run_agent(verdict_writer_agent, prompt)
+        verdict = result.final_output_as(Verdict)
+        if self.cache_enabled:
+            self.cache.set(cache_key, verdict)
+        return verdict
+
+    async def _generate_verdicts_batch(
+        self, claims_with_evidence: list[tuple[Claim, list[Evidence]]]
+    ) -> list[Verdict]:
+        cache_keys = [
+            _verdict_cache_key(claim, evidence) for claim, evidence in claims_with_evidence
+        ]
+        verdicts = [self.cache.get(key) if self.cache_enabled else None for key in cache_keys]
+        misses = [idx for idx, verdict in enumerate(verdicts) if verdict is None]
+        if len(misses) < len(verdicts):
+            logger.info("Using %d cached verdicts", len(verdicts) - len(misses))
+
+        # Only pay for the batch writer when more than one claim still needs a verdict
+        if len(misses) == 1:
+            verdicts[misses[0]] = await self._generate_verdict_for_claim(
+                *claims_with_evidence[misses[0]]
+            )
+        elif misses:
+            generated = await self._write_verdicts_batch(
+                [claims_with_evidence[idx] for idx in misses]
+            )
+            for idx, verdict in zip(misses, generated, strict=True):
+                verdicts[idx] = verdict
+                if self.cache_enabled:
+                    self.cache.set(cache_keys[idx], verdict)
+        return verdicts
+
+    async def _write_verdicts_batch(
+        self, claims_with_evidence: list[tuple[Claim, list[Evidence]]]
+    ) -> list[Verdict]:
+        logger.info("Generating %d verdicts in a single call...", len(claims_with_evidence))
+
+        prompt = "\n".join(
+            f"""
+        Claim {idx + 1} to investigate: {claim.text}
+        Evidence for claim {idx + 1}: {evidence}
+        """
+            for idx, (claim, evidence) in enumerate(claims_with_evidence)
+        )
+
+        result = await self._run_agent(batch_verdict_writer_agent, prompt)
+        # Match verdicts to claims by text rather than position, since the model may reorder them
+        verdicts_by_claim = {
+            _claim_match_key(verdict.claim): verdict
+            for verdict in result.final_output_as(list[Verdict])
+        }
+        verdicts = [
+            verdicts_by_claim.get(_claim_match_key(claim.text)) for claim, _ in claims_with_evidence
+        ]
+        unmatched = [idx for idx, verdict in enumerate(verdicts) if verdict is None]
+        if unmatched:
+            logger.warning(
+                "Batched verdicts matched %d of %d claims, generating the rest per claim",
+                len(verdicts) - len(unmatched),
+                len(claims_with_evidence),
+            )
+            retried = await asyncio.gather(
+                *(self._generate_verdict_for_claim(*claims_with_evidence[idx]) for idx in unmatched)
+            )
+            for idx, verdict in zip(unmatched, retried, strict=True):
+                verdicts[idx] = verdict
+        return verdicts
 
     async def _generate_all_verdicts(
         self, claims_with_evidence: list[tuple[Claim, list[Evidence]]]
     ) -> list[Verdict]:
         logger.info("Generating verdicts...")
-        verdicts = []
+        pairs_with_evidence = []
         for claim, evidence in claims_with_evidence:
             logger.info("Claim: %s", claim.text[:50])
             if not evidence:
                 logger.warning("Skipping claim - no evidence found")
                 continue
 
-            logger.info("Evidence: %s | %s", evidence, type(evidence))
+            logger.debug("Evidence: %s | %s", evidence, type(evidence))
             logger.info("Generating verdict for claim with %d evidence pieces", len(evidence))
-            verdict = await self._generate_verdict_for_claim(claim, evidence)
+            pairs_with_evidence.append((claim, evidence))
 
-            verdicts.append(verdict)
+        verdicts = await asyncio.gather(
+            *(
+                self._generate_verdict_for_claim(claim, evidence)
+                for claim, evidence in pairs_with_evidence
+            )
+        )
+        for verdict in verdicts:
             logger.info("Generated verdict: %s", verdict.verdict)
 
-        return verdicts
+        return list(verdicts)
 
 
 # testing